@@ -22,12 +22,14 @@ You can optionally pass: --table-css "#pn_id_910-table"
 import os
 import re
 import csv
-import sys
 import json
 import time
+import atexit
 import argparse
+import functools
+import threading
 from datetime import datetime, timedelta
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -36,24 +38,129 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchFrameException, WebDriverException
 
+try:
+    import orjson  # optional: C serializer, same output as json.dump(indent=2, ensure_ascii=False)
+except ImportError:
+    orjson = None
+
 LOG_FILE = "laredo.logs"
 FLOW_LOG = "laredo-flow-logs.json"
 
+# Fallback table selectors tried (after --table-css) while waiting for the results table
+TABLE_SELECTORS = (
+    "table[role='table']",
+    "table.p-datatable-table",
+    "#pn_id_910-table",
+)
+
+# Normalized header labels we look for (exact match first, then substring)
+WANTED_COLUMNS = (
+    "doc number",
+    "party",
+    "book & page",
+    "doc date",
+    "recorded date",
+    "doc type",
+    "assoc doc",
+    "legal summary",
+    "consideration",
+    "additional party",
+    "pages",
+)
+CRITICAL_COLUMNS = ("doc number", "doc date", "recorded date")
+
+# Output record layout: id, Doc Number, Party1..N, then these detail fields
+RECORD_DETAIL_FIELDS = (
+    "Book & Page",
+    "Doc Date",
+    "Recorded Date",
+    "Doc Type",
+    "Assoc Doc",
+    "Legal Summary",
+    "Consideration",
+    "Pages",
+)
+
+# Background Chrome features the scrape never uses
+CHROME_LEAN_FLAGS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+)
+
+# WebDriverWait poll interval (Selenium default is 0.5s)
+WAIT_POLL_S = 0.1
+
+# Static assets and third-party trackers the table scrape never reads; blocked at the
+# network layer via CDP. Stylesheets stay enabled: PrimeNG layout (and its virtual
+# scroller) depends on them.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.webp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+]
+
 # ---------------- logging ----------------
+_LOG_FH = None
+_LOG_LOCK = threading.Lock()
+_TS_CACHE = [-1, ""]  # [epoch second, formatted UTC timestamp]
+
+def _log_handle():
+    """Open LOG_FILE once (line-buffered) and keep it for the life of the process."""
+    global _LOG_FH
+    if _LOG_FH is None:
+        _LOG_FH = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+        atexit.register(_LOG_FH.close)
+    return _LOG_FH
+
+def _log_ts() -> str:
+    """UTC timestamp for log lines, reformatted at most once per second."""
+    sec = int(time.time())
+    if sec != _TS_CACHE[0]:
+        _TS_CACHE[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+        _TS_CACHE[0] = sec
+    return _TS_CACHE[1]
+
 def log(msg: str):
-    ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    line = f"[{ts}] {msg}"
+    line = f"[{_log_ts()}] {msg}"
     print(line, flush=True)
     try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        with _LOG_LOCK:
+            _log_handle().write(line + "\n")
     except Exception:
         pass
 
+def dump_json(data, path: str):
+    """
+    Write data to path as indented UTF-8 JSON (orjson when available).
+    Goes through <path>.tmp + os.replace so readers never see a torn file.
+    """
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # don't leave a partial .tmp in the output dir (the results workflow commits files/)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
 def write_flow_log(data):
     try:
-        with open(FLOW_LOG, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        dump_json(data, FLOW_LOG)
     except Exception as e:
         log(f"Failed writing flow log: {e}")
 
@@ -69,25 +176,53 @@ def get_args():
     ap.add_argument("--start-url", default=os.environ.get("LAREDO_URL", ""), help="Direct URL to St. Charles table")
     ap.add_argument("--iframe-css", default="", help="CSS for iframe containing the table (if any)")
     ap.add_argument("--table-css", default="", help="CSS for the table (optional override)")
+    ap.add_argument("--max-scroll-pages", type=int, default=50,
+                    help="Max viewport pages to scroll a virtual-scroll table (0=disable)")
+    ap.add_argument("--block-assets", action=argparse.BooleanOptionalAction, default=True,
+                    help="Block images/fonts/analytics (Chrome prefs + CDP; default: on)")
     return ap.parse_args()
 
 # ---------------- driver ----------------
-def build_driver(headless: bool):
+def build_driver(headless: bool, block_assets: bool = True):
     opts = ChromeOptions()
-    if headless:
-        opts.add_argument("--headless=new")
-    opts.add_argument("--disable-gpu")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--window-size=1920,1480")
-    opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument("--disable-blink-features=AutomationControlled")
-    prefs = {
-        "profile.default_content_setting_values.notifications": 2,
-        "download.prompt_for_download": False,
-    }
-    opts.add_experimental_option("prefs", prefs)
+    # Return from get()/refresh() at DOMContentLoaded; the table itself is awaited
+    # explicitly (_robust_wait_for_table) instead of waiting on every subresource.
+    opts.page_load_strategy = "eager"
+    debugger_addr = os.environ.get("LAREDO_DEBUGGER_ADDR", "")
+    if debugger_addr:
+        # Attach to an already-running Chrome (started with --remote-debugging-port)
+        # to skip cold start; launch flags/prefs don't apply to an existing browser.
+        log(f"Attaching to running Chrome at {debugger_addr}")
+        opts.add_experimental_option("debuggerAddress", debugger_addr)
+    else:
+        if headless:
+            opts.add_argument("--headless=new")
+        opts.add_argument("--disable-gpu")
+        opts.add_argument("--no-sandbox")
+        opts.add_argument("--window-size=1920,1480")
+        opts.add_argument("--disable-dev-shm-usage")
+        opts.add_argument("--disable-blink-features=AutomationControlled")
+        for flag in CHROME_LEAN_FLAGS:
+            opts.add_argument(flag)
+        profile_dir = os.environ.get("LAREDO_CHROME_PROFILE", "")
+        if profile_dir:
+            # persistent profile: warm HTTP cache/cookies across runs
+            opts.add_argument(f"--user-data-dir={os.path.abspath(os.path.expanduser(profile_dir))}")
+        prefs = {
+            "profile.default_content_setting_values.notifications": 2,
+            "download.prompt_for_download": False,
+        }
+        if block_assets:
+            prefs["profile.managed_default_content_settings.images"] = 2
+        opts.add_experimental_option("prefs", prefs)
     driver = webdriver.Chrome(options=opts)
     driver.set_page_load_timeout(180)
+    if block_assets:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            log(f"WARNING: could not block static assets via CDP: {e}")
     return driver
 
 # ---------------- debug helpers ----------------
@@ -104,7 +239,7 @@ def _switch_iframe(driver, iframe_css: str):
     if not iframe_css:
         return
     try:
-        frame = WebDriverWait(driver, 12).until(
+        frame = WebDriverWait(driver, 12, poll_frequency=WAIT_POLL_S).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, iframe_css))
         )
         driver.switch_to.frame(frame)
@@ -112,18 +247,35 @@ def _switch_iframe(driver, iframe_css: str):
     except (TimeoutException, NoSuchFrameException) as e:
         log(f"WARNING: iframe not found ({iframe_css}). Continuing in main context. {e}")
 
-def _robust_wait_for_table(driver, table_css: str, wait_s: int):
-    selectors = [
-        table_css or "",
-        "table[role='table']",
-        "table.p-datatable-table",
-        "#pn_id_910-table",
-    ]
-    end = time.time() + max(wait_s, 15)
+def _wait_ready(driver, wait_s: int):
+    """Block until the DOM is parsed (readyState past 'loading'); replaces fixed post-load sleeps."""
+    timeout = max(wait_s, 5)
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_S).until(
+            lambda d: d.execute_script("return document.readyState") != "loading"
+        )
+    except (TimeoutException, WebDriverException) as e:
+        log(f"WARNING: page not ready after {timeout}s; continuing. {e}")
+
+# Resolves with the first selector whose table has header cells and body rows, using a
+# MutationObserver in the page instead of polling from Python ("" on timeout).
+_TABLE_READY_JS = """
+const sels = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+const find = () => sels.find(s => document.querySelector(s + " thead th") && document.querySelector(s + " tbody tr")) || "";
+const hit = find();
+if (hit) { done(hit); return; }
+const obs = new MutationObserver(() => {
+  const sel = find();
+  if (sel) { obs.disconnect(); clearTimeout(timer); done(sel); }
+});
+const timer = setTimeout(() => { obs.disconnect(); done(""); }, timeoutMs);
+obs.observe(document, {subtree: true, childList: true});
+"""
+
+def _poll_for_table(driver, selectors, timeout: int):
+    end = time.time() + timeout
     while time.time() < end:
         for sel in selectors:
-            if not sel:
-                continue
             try:
                 if driver.find_elements(By.CSS_SELECTOR, f"{sel} thead th"):
                     if driver.find_elements(By.CSS_SELECTOR, f"{sel} tbody tr"):
@@ -133,13 +285,24 @@ def _robust_wait_for_table(driver, table_css: str, wait_s: int):
         time.sleep(0.8)
     return ""
 
+def _robust_wait_for_table(driver, table_css: str, wait_s: int):
+    selectors = (table_css,) + TABLE_SELECTORS if table_css else TABLE_SELECTORS
+    timeout = max(wait_s, 15)
+    try:
+        # returns as soon as rows render, with no Python-side polling interval
+        driver.set_script_timeout(timeout + 5)
+        return driver.execute_async_script(_TABLE_READY_JS, list(selectors), timeout * 1000) or ""
+    except WebDriverException as e:
+        log(f"In-page table wait failed ({e.__class__.__name__}); falling back to polling.")
+    return _poll_for_table(driver, selectors, timeout)
+
 def navigate(driver, start_url: str, iframe_css: str, table_css: str, wait_s: int):
     if start_url:
         log(f"Opening start URL: {start_url}")
-        driver.get(start_url)
+        driver.get(start_url)  # eager strategy: returns once readyState leaves 'loading'
     else:
         log("No --start-url provided; using current page.")
-    time.sleep(2)
+        _wait_ready(driver, wait_s)
     _switch_iframe(driver, iframe_css)
 
     base_sel = _robust_wait_for_table(driver, table_css, wait_s)
@@ -147,7 +310,6 @@ def navigate(driver, start_url: str, iframe_css: str, table_css: str, wait_s: in
         log("Table not found; refreshing once…")
         try:
             driver.refresh()
-            time.sleep(2)
             _switch_iframe(driver, iframe_css)
             base_sel = _robust_wait_for_table(driver, table_css, wait_s)
         except Exception as e:
@@ -159,48 +321,81 @@ def navigate(driver, start_url: str, iframe_css: str, table_css: str, wait_s: in
     return base_sel
 
 # ---------------- scraping ----------------
-def safe_text(el):
-    try:
-        return el.text.strip()
-    except Exception:
-        return ""
+_ROLES = ("GRANTOR", "GRANTEE")
+_ROLE_RE = re.compile(r"\b(GRANTOR|GRANTEE)\b")  # matched against the upper-cased chip
+_WS_RE = re.compile(r"\s+")
+# Table date formats: 'Sep 12, 2025, 8:27 AM' and 'Sep 10, 2025'
+_DATE_FORMATS = ("%b %d, %Y, %I:%M %p", "%b %d, %Y")
+
+# One round-trip for the whole table. Cell text is innerText, i.e. rendered text like
+# Selenium's .text (line breaks kept, CSS-hidden text such as PrimeNG's responsive
+# column titles dropped). Each cell is [text, first <span> text, .party-chip text].
+_TABLE_SNAPSHOT_JS = """
+const t = document.querySelector(arguments[0]);
+if (!t) return null;
+const txt = el => el ? el.innerText : null;
+return {
+  headers: Array.from(t.querySelectorAll("thead th"), th => th.innerText),
+  rows: Array.from(t.querySelectorAll("tbody tr"), tr =>
+    Array.from(tr.querySelectorAll(":scope > td"), td =>
+      [td.innerText, txt(td.querySelector("span")), txt(td.querySelector(".party-chip"))])),
+};
+"""
+
+def safe_text(text):
+    """Trimmed rendered text ('' if missing)."""
+    return (text or "").strip()
+
+def fetch_table(driver, base_sel: str):
+    """
+    Snapshot the table's header labels and row cells in one WebDriver call,
+    instead of one round-trip per row/cell. Returns {"headers", "rows"} (or None).
+    """
+    return driver.execute_script(_TABLE_SNAPSHOT_JS, base_sel)
 
 def normalize_header(text: str) -> str:
-    t = (text or "").strip().lower()
-    t = re.sub(r"\s+", " ", t)
-    return t
+    return _WS_RE.sub(" ", (text or "").strip().lower())
 
-def map_columns(table_elem):
+def map_columns(table):
     """
     Read header <th> text and return a mapping {normalized_header: column_index}.
     """
-    headers = table_elem.find_elements(By.CSS_SELECTOR, "thead th")
     mapping = {}
-    for idx, th in enumerate(headers):
-        label = normalize_header(th.text)
+    for idx, th in enumerate(table["headers"]):
+        label = normalize_header(th)
         if not label:
             # some columns (index/images/shielded) may be blank; keep them mapped by index if needed
             continue
         mapping[label] = idx
     return mapping
 
-def extract_party_and_role(td_elem):
+def extract_party_and_role(cell):
     # Name in first span; role chip includes GRANTOR/GRANTEE
-    name = ""
+    text, span, chip = cell
+    name = safe_text(span) if span is not None else safe_text(text)
     role = ""
-    try:
-        name = safe_text(td_elem.find_element(By.CSS_SELECTOR, "span"))
-    except Exception:
-        name = safe_text(td_elem)
-    try:
-        chip = td_elem.find_element(By.CSS_SELECTOR, ".party-chip")
-        m = re.search(r"\b(GRANTOR|GRANTEE)\b", chip.text, re.IGNORECASE)
-        if m:
-            role = m.group(1).upper()
-    except Exception:
-        role = ""
+    if chip is not None:
+        chip = safe_text(chip).upper()
+        if chip in _ROLES:  # common case: the chip is just the role
+            role = chip
+        else:
+            m = _ROLE_RE.search(chip)
+            if m:
+                role = m.group(1)
     return f"{name} ({role})" if name and role else name
 
+@functools.lru_cache(maxsize=4096)
+def _parse_date(s: str):
+    # many rows share a recording day, so cache per distinct string;
+    # only the date+time form has a second comma, so try the likely format first
+    fmts = _DATE_FORMATS if s.count(",") > 1 else _DATE_FORMATS[::-1]
+    for fmt in fmts:
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            continue
+    return None
+
 def parse_date_raw(s: str):
     """
     We keep raw strings for JSON, but this helper can validate if needed.
@@ -209,110 +404,158 @@ def parse_date_raw(s: str):
     s = (s or "").strip()
     if not s:
         return None, ""
-    for fmt in ("%b %d, %Y, %I:%M %p", "%b %d, %Y"):
-        try:
-            return datetime.strptime(s, fmt), s
-        except Exception:
-            continue
-    return None, s  # return original string even if parse failed
+    return _parse_date(s), s  # return original string even if parse failed
+
+# Locates the PrimeNG virtual scroller (sc) around the table (t); shared by the scripts below.
+_FIND_SCROLLER_JS = """
+const t = document.querySelector(arguments[0]);
+const sc = t && t.closest(".p-scroller, cdk-virtual-scroll-viewport, .p-datatable-virtual-scrollable-body");
+"""
+
+# Scrolls the virtual scroller down ~one viewport (or back to the top when arguments[1]
+# is true) and resolves once the body has stopped re-rendering (100ms without
+# mutations, capped at 1s), so a first render pass or lazy-load placeholder rows
+# aren't snapshotted. Resolves false when the table isn't virtualized or didn't move.
+_SCROLL_STEP_JS = _FIND_SCROLLER_JS + """
+const toTop = arguments[1], done = arguments[arguments.length - 1];
+if (!sc) { done(false); return; }
+const before = sc.scrollTop;
+sc.scrollTop = toTop ? 0 : before + sc.clientHeight * 0.9;
+if (toTop ? sc.scrollTop >= before : sc.scrollTop <= before) { done(false); return; }
+let quiet;
+const finish = () => { obs.disconnect(); clearTimeout(quiet); clearTimeout(cap); done(true); };
+const obs = new MutationObserver(() => { clearTimeout(quiet); quiet = setTimeout(finish, 100); });
+const cap = setTimeout(finish, 1000);
+obs.observe(t.querySelector("tbody") || t, {subtree: true, childList: true, characterData: true});
+"""
+
+_SCROLL_AT_END_JS = _FIND_SCROLLER_JS + """
+return !sc || sc.scrollTop + sc.clientHeight >= sc.scrollHeight - 1;
+"""
 
-def rows_to_records(driver, base_sel: str, county_slug: str, max_parties: int, wait_s: int, days_back: int):
-    # Locate the concrete table element for consistent scoping
-    table = driver.find_element(By.CSS_SELECTOR, base_sel)
+def scroll_virtual_rows(driver, base_sel: str, max_pages: int):
+    """
+    PrimeNG virtual scroll only renders rows near the viewport, so one snapshot misses
+    the rest. Page the scroll container down and snapshot each page's rows; pages
+    overlap, and repeated rows merge by Doc Number downstream. [] if not virtualized.
+    """
+    extra = []
+    for _ in range(max_pages):
+        if not driver.execute_async_script(_SCROLL_STEP_JS, base_sel, False):
+            break
+        table = fetch_table(driver, base_sel)
+        if table is None:
+            break
+        extra.extend(table["rows"])
+    else:
+        if not driver.execute_script(_SCROLL_AT_END_JS, base_sel):
+            log(f"WARNING: virtual scroll stopped after {max_pages} pages before the end of the table; "
+                f"rows below were not collected (raise --max-scroll-pages).")
+    return extra
+
+def pages_value(raw: str):
+    """Page count as int when the cell is numeric, else the raw string."""
+    return int(raw) if raw.isdecimal() else raw
+
+def rows_to_records(driver, base_sel: str, county_slug: str, max_parties: int, wait_s: int, days_back: int,
+                    max_scroll_pages: int = 0):
+    if max_scroll_pages > 0:
+        # virtual scroll collects downward from the first snapshot, so start it at the top
+        try:
+            driver.execute_async_script(_SCROLL_STEP_JS, base_sel, True)
+        except WebDriverException as e:
+            log(f"WARNING: could not reset virtual scroll to the top. {e}")
+
+    # Snapshot the concrete table once; all row/cell reads below are in-process
+    table = fetch_table(driver, base_sel)
+    if table is None:
+        raise TimeoutException(f"Results table disappeared before scrape: {base_sel}")
     colmap = map_columns(table)
 
     # Figure out required columns by fuzzy header names
     # (normalize_header() is used, so match lowercase)
+    # exact header match first, else the first header containing the key as substring
+    headers = list(colmap.items())
     want = {
-        "doc number": None,
-        "party": None,
-        "book & page": None,
-        "doc date": None,
-        "recorded date": None,
-        "doc type": None,
-        "assoc doc": None,
-        "legal summary": None,
-        "consideration": None,
-        "additional party": None,
-        "pages": None,
+        key: colmap[key] if key in colmap else next((i for h, i in headers if key in h), None)
+        for key in WANTED_COLUMNS
     }
-    for key in list(want.keys()):
-        # find the first header containing the key (exact or startswith)
-        exact = colmap.get(key)
-        if exact is not None:
-            want[key] = exact
-            continue
-        # fallback: look for any header that contains key as substring
-        for htext, idx in colmap.items():
-            if key in htext:
-                want[key] = idx
-                break
 
-    missing = [k for k, v in want.items() if v is None and k in ("doc number", "doc date", "recorded date")]
+    missing = [k for k, v in want.items() if v is None and k in CRITICAL_COLUMNS]
     if missing:
         log(f"WARNING: missing critical header(s): {missing} — dates may not be captured.")
 
     # Collect all rows within this table
-    rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
+    rows = table["rows"]
     if not rows:
         # try a gentle breathe scroll in case of virtual rendering
         try:
-            driver.execute_script("arguments[0].scrollIntoView(true);", table)
-            time.sleep(1)
+            driver.execute_script("document.querySelector(arguments[0]).scrollIntoView(true);", base_sel)
+            WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_S).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, f"{base_sel} tbody tr"))
+            )
+        except Exception:
+            pass
+        try:
+            table = fetch_table(driver, base_sel)
         except Exception:
             pass
-        rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
+        rows = table["rows"] if table is not None else []
+    if rows and max_scroll_pages > 0:
+        try:
+            more = scroll_virtual_rows(driver, base_sel, max_scroll_pages)
+            if more:
+                log(f"Virtual scroll: collected {len(more)} additional row snapshots")
+                rows.extend(more)
+        except WebDriverException as e:
+            log(f"WARNING: virtual scroll failed; using rendered rows only. {e}")
 
     bucket = {}
     per_doc_parties = defaultdict(list)
+    per_doc_seen = defaultdict(set)  # O(1) dedupe alongside the ordered party list
 
     min_doc_date = None
     if days_back and days_back > 0:
         min_doc_date = datetime.utcnow().date() - timedelta(days=days_back)
 
+    # Resolve column indices once; rows then read cells by position only
+    i_party, i_addl = want["party"], want["additional party"]
+    text_cols = tuple(want[k] for k in (
+        "doc number", "book & page", "doc date", "recorded date", "doc type",
+        "assoc doc", "legal summary", "consideration", "pages",
+    ))
+
+    fields = record_fields(max_parties)
+    id_prefix = f"{county_slug}-"
     count = 0
-    for row in rows:
+    for tds in rows:
         try:
-            tds = row.find_elements(By.TAG_NAME, "td")
             if not tds:
                 continue
+            n = len(tds)
 
-            def cell(idx):
-                return safe_text(tds[idx]) if idx is not None and idx < len(tds) else ""
-
-            doc_number = cell(want["doc number"])
+            (doc_number, book_page, doc_date_raw, recorded_date_raw, doc_type,
+             assoc_doc, legal_summary, consideration, pages_raw) = [
+                safe_text(tds[i][0]) if i is not None and i < n else "" for i in text_cols
+            ]
             if not doc_number:
                 continue
+            book_page = book_page or None
 
-            party_main = ""
-            if want["party"] is not None and want["party"] < len(tds):
-                party_main = extract_party_and_role(tds[want["party"]])
-
-            party_addl = ""
-            if want["additional party"] is not None and want["additional party"] < len(tds):
-                party_addl = extract_party_and_role(tds[want["additional party"]])
-
-            book_page = cell(want["book & page"]) or None
-            doc_date_raw = cell(want["doc date"])
-            recorded_date_raw = cell(want["recorded date"])
-            doc_type = cell(want["doc type"])
-            assoc_doc = cell(want["assoc doc"])
-            legal_summary = cell(want["legal summary"])
-            consideration = cell(want["consideration"])
-            pages_raw = cell(want["pages"])
+            party_main = extract_party_and_role(tds[i_party]) if i_party is not None and i_party < n else ""
+            party_addl = extract_party_and_role(tds[i_addl]) if i_addl is not None and i_addl < n else ""
 
             # Optional filter by days-back using Doc Date (if parseable)
             dt_doc, _ = parse_date_raw(doc_date_raw)
             if min_doc_date and dt_doc and dt_doc.date() < min_doc_date:
                 continue
 
-            if doc_number not in bucket:
+            rec = bucket.get(doc_number)
+            if rec is None:
                 count += 1
-                rec = OrderedDict()
-                rec["id"] = f"{county_slug}-{count}"
+                rec = dict.fromkeys(fields, "")
+                rec["id"] = id_prefix + str(count)
                 rec["Doc Number"] = doc_number
-                for i in range(1, max_parties + 1):
-                    rec[f"Party{i}"] = ""
                 rec["Book & Page"] = book_page
                 rec["Doc Date"] = doc_date_raw              # <-- FROM TABLE
                 rec["Recorded Date"] = recorded_date_raw     # <-- FROM TABLE
@@ -320,36 +563,28 @@ def rows_to_records(driver, base_sel: str, county_slug: str, max_parties: int, w
                 rec["Assoc Doc"] = assoc_doc
                 rec["Legal Summary"] = legal_summary
                 rec["Consideration"] = consideration
-                try:
-                    rec["Pages"] = int(pages_raw)
-                except Exception:
-                    rec["Pages"] = pages_raw
+                rec["Pages"] = pages_value(pages_raw)
                 bucket[doc_number] = rec
-
-            rec = bucket[doc_number]
-            # Enrich/merge if blanks
-            if (not rec.get("Book & Page")) and book_page:
-                rec["Book & Page"] = book_page
-            if (not rec.get("Doc Date")) and doc_date_raw:
-                rec["Doc Date"] = doc_date_raw
-            if (not rec.get("Recorded Date")) and recorded_date_raw:
-                rec["Recorded Date"] = recorded_date_raw
-            if (not rec.get("Doc Type")) and doc_type:
-                rec["Doc Type"] = doc_type
-            if (not rec.get("Assoc Doc")) and assoc_doc:
-                rec["Assoc Doc"] = assoc_doc
-            if (not rec.get("Legal Summary")) and legal_summary:
-                rec["Legal Summary"] = legal_summary
-            if (isinstance(rec.get("Pages"), str) or not rec.get("Pages")) and pages_raw:
-                try:
-                    rec["Pages"] = int(pages_raw)
-                except Exception:
-                    rec["Pages"] = pages_raw
+            else:
+                # Duplicate doc number: enrich/merge if blanks
+                for key, val in (
+                    ("Book & Page", book_page),
+                    ("Doc Date", doc_date_raw),
+                    ("Recorded Date", recorded_date_raw),
+                    ("Doc Type", doc_type),
+                    ("Assoc Doc", assoc_doc),
+                    ("Legal Summary", legal_summary),
+                ):
+                    if val and not rec[key]:
+                        rec[key] = val
+                if pages_raw and (isinstance(rec["Pages"], str) or not rec["Pages"]):
+                    rec["Pages"] = pages_value(pages_raw)
 
             # Parties
             for p in (party_main, party_addl):
                 p = (p or "").strip()
-                if p and p not in per_doc_parties[doc_number]:
+                if p and p not in per_doc_seen[doc_number]:
+                    per_doc_seen[doc_number].add(p)
                     per_doc_parties[doc_number].append(p)
 
         except Exception as e:
@@ -366,27 +601,26 @@ def rows_to_records(driver, base_sel: str, county_slug: str, max_parties: int, w
     return list(bucket.values())
 
 # ---------------- output ----------------
+def record_fields(max_parties: int):
+    """Column order of every record built by rows_to_records."""
+    parties = [f"Party{i}" for i in range(1, max_parties + 1)]
+    return ["id", "Doc Number", *parties, *RECORD_DETAIL_FIELDS]
+
 def ensure_out(out_dir: str):
     os.makedirs(out_dir, exist_ok=True)
 
-def save_json_csv(records, out_dir: str, county_slug: str):
+def save_json_csv(records, out_dir: str, county_slug: str, max_parties: int):
     json_path = os.path.join(out_dir, f"{county_slug}.json")
     csv_path = os.path.join(out_dir, f"{county_slug}.csv")
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(records, f, indent=2, ensure_ascii=False)
+    dump_json(records, json_path)
 
-    headers = OrderedDict()
-    for r in records:
-        for k in r.keys():
-            headers[k] = True
-    headers = list(headers.keys())
+    headers = record_fields(max_parties)
 
     with open(csv_path, "w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=headers)
-        w.writeheader()
-        for r in records:
-            w.writerow(r)
+        w = csv.writer(f)
+        w.writerow(headers)
+        w.writerows([r.get(h, "") for h in headers] for r in records)
 
     log(f"Wrote {json_path} and {csv_path}")
     return json_path, csv_path
@@ -409,7 +643,7 @@ def main():
 
     driver = None
     try:
-        driver = build_driver(args.headless)
+        driver = build_driver(args.headless, args.block_assets)
         base_sel = navigate(driver, args.start_url, args.iframe_css, args.table_css, args.wait)
 
         flow["steps"].append({"event": "scrape_begin", "ts": datetime.utcnow().isoformat()})
@@ -420,10 +654,11 @@ def main():
             max_parties=args.max_parties,
             wait_s=args.wait,
             days_back=args.days_back,
+            max_scroll_pages=args.max_scroll_pages,
         )
         flow["steps"].append({"event": "records", "count": len(records)})
 
-        json_path, csv_path = save_json_csv(records, args.out, args.county_slug)
+        json_path, csv_path = save_json_csv(records, args.out, args.county_slug, args.max_parties)
         flow["finished_ok"] = True
         flow["records"] = len(records)
         flow["json_path"] = json_path